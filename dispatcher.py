@@ -1,28 +1,25 @@
 # 分发器
-import importlib.util
-from pathlib import Path
+from typing import Optional
+from . import testing, fissures  # 以包内相对导入的方式加载同级模块
 
 
-# 动态加载模块方案
-def load_module(module_name: str):
-    module_path = Path(__file__).parent / f"{module_name}.py"
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+async def run_fissures(message: str) -> str:
+    msg = await fissures.run_fissures_module()
+    return str(msg)  # 裂缝模块返回的是记录字典，在此统一转为字符串
 
 
-testing = load_module("testing")
-fissures = load_module("fissures")
+# 指令与对应功能模块的对照表，新增指令只需在此登记
+_HANDLERS = {
+    "测试": testing.test,
+    "蹲": run_fissures,
+}
+# 所有会触发插件功能的指令，不在其中的消息直接忽略
+TRIGGERS = _HANDLERS.keys()
 
 
-# 异步函数：根据不同的消息内容分发调用相应的功能模块
-async def magic_message(message: str) -> str:
-    if message == "测试":
-        msg = await testing.test(message)
-        return msg
-    elif message == "蹲":
-        msg = fissures.run_fissures_module()
-        return msg
-    else:
-        return "1"
+# 异步函数：根据不同的消息内容分发调用相应的功能模块，匹配时总是返回字符串
+async def magic_message(message: str) -> Optional[str]:
+    handler = _HANDLERS.get(message)
+    if handler is None:
+        return None  # 未匹配任何指令，不回复
+    return await handler(message)
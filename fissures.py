@@ -1,5 +1,7 @@
-import requests  # 导入 requests 模块，用于发送 HTTP 请求
-import json
+import aiohttp  # 导入 aiohttp 模块，用于发送异步 HTTP 请求
+import asyncio
+import orjson  # 比标准库 json 更快的 JSON 编解码库
+import time
 from opencc import OpenCC
 from datetime import datetime  # 导入 datetime 模块中的 datetime 类
 
@@ -8,64 +10,158 @@ language = "zh"  # 设置语言参数，获取中文数据
 
 # 构造 fissures 接口的 URL，包含路径参数和查询参数
 url = f"https://api.warframestat.us/{platform}/fissures?language={language}"  # 拼接完整的 URL
-response = requests.get(url)  # 发送 GET 请求获取 fissures 数据
-
-
-def update_fissures_data():
-    if response.status_code == 200:  # 若请求成功，状态码为 200
-        fissures = response.json()  # 将响应的 JSON 数据解析为 Python 列表
-        cc = OpenCC('t2s')  # 将繁体转换为简体，配置 't2s' （Traditional to Simplified）
-        # 使用列表推导式筛选出还未过期的 fissure（expired 为 False 的记录）
-        active_fissures = [f for f in fissures if not f.get("expired", False)]
-        output_list = []  # 初始化一个空列表，用于存储每个 fissure 的关键信息
-        # 获取当前 UTC 时间，并格式化为 ISO 8601 格式，其中 timespec='milliseconds' 表示保留毫秒部分
-        now = datetime.utcnow().isoformat(timespec='milliseconds') + 'Z'
-        # 遍历筛选后的 fissure 列表，输出每个 fissure 的关键信息
-        for fissure in active_fissures:
-            # 假设 fissure 中有 'node'、'missionType' 等字段需要转换
-            node_traditional = fissure.get("node", "")
-            mission_type_traditional = fissure.get("missionType", "")
-            # 转换为简体中文
-            node = cc.convert(node_traditional)  # 获取 fissure 所在的节点
-            mission_type = cc.convert(mission_type_traditional)  # 获取任务类型
-            ID = fissure.get("id")  # 获取此任务的ID
-            tier = fissure.get("tier")  # 获取 fissure
-            eta = fissure.get("eta")  # 获取剩余有效时间
-            ishard = fissure.get("isHard")  # 是否为钢铁之路
-            expiry = fissure.get("expiry")  # 节点的结束时间
-            # 构建一本字典，每个字段均封装为带有 value 和 type 的结构
-            output_line = {
-                "ID": {"value": ID, "type": "id"},  # ID 标记为字符串类型
-                "node": {"value": node, "type": "string"},  # 节点名称为字符串
-                "missionType": {"value": mission_type, "type": "string"},  # 任务类型为字符串
-                "tier": {"value": tier, "type": "string"},  # 缝隙类型为字符串
-                "eta": {"value": eta, "type": "time"},  # 剩余时间被标记为时间类型
-                "isHard": {"value": ishard, "type": "boolean"},  # 是否为钢铁之路为布尔类型
-                "expiry": {"value": expiry, "type": "time"},  # 标记节点的结束时间
-                "now": {"value": now, "type": "time"}
-            }
-            # 将当前记录添加到列表中
-            output_list.append(output_line)
-            # 将收集到的数据写入到一个 JSON 文件中
-        with open("fissures.json", "w", encoding="utf-8") as f:
-            # 使用 json.dump() 写入数据，indent=4 实现美化格式，ensure_ascii=False 保证中文不被转义
-            json.dump(output_list, f, ensure_ascii=False, indent=4)
-        print("数据已成功记录到文件中。")
+
+# 将繁体转换为简体，配置 't2s' （Traditional to Simplified），模块加载时只创建一次，避免反复读取转换词典
+_CC = OpenCC('t2s')
+_SEP = "\x01"  # 批量转换时拼接各条文本用的分隔符，选用不会出现在节点名中的控制字符
+
+SAVE_TO_FILE = False  # 是否把每次获取的数据另存到 fissures.json（仅用于排查问题）
+CACHE_TTL = 30  # 缓存有效期（秒），在此期间重复的 "蹲" 直接复用上次结果
+
+# 进程内缓存：保存上次的查询结果、获取时间以及该结果节点的结束时间戳
+_cache = {"data": None, "fetched_at": 0.0, "min_expiry_ts": 0.0}
+_refresh_task = None  # 正在进行的刷新任务，缓存失效后的并发请求共享同一次刷新的结果
+
+REQUEST_TIMEOUT = 10  # 请求接口的总超时时间（秒），避免接口卡住时指令长时间无响应
+
+_session = None  # 模块级共享的 aiohttp 会话，首次使用时创建，之后复用连接
+
+
+def get_session() -> aiohttp.ClientSession:
+    # 懒加载共享会话：保持长连接并缓存 DNS，避免每次 "蹲" 都重新握手
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+        )
+    return _session
+
+
+async def close_session():
+    # 关闭共享会话，供插件卸载时调用
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def update_fissures_data():
+    session = get_session()
+    try:
+        async with session.get(url) as response:  # 发送 GET 请求获取 fissures 数据
+            if response.status != 200:
+                # 如果请求失败，则打印出错误状态码
+                print(f"请求失败，状态码: {response.status}")
+                return None
+            fissures = orjson.loads(await response.read())  # 将响应的 JSON 数据解析为 Python 列表
+    except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+        # 网络异常、超时或返回内容无法解析时，与非 200 响应一样按请求失败处理
+        print(f"请求失败: {e!r}")
+        return None
+    if not isinstance(fissures, list):
+        # 接口返回的不是列表（例如错误信息对象），同样按请求失败处理
+        print(f"返回数据格式异常: {type(fissures).__name__}")
+        return None
+    # 使用列表推导式筛选出还未过期的 fissure（expired 为 False 的记录），并跳过缺少结束时间等格式不对的记录
+    active_fissures = [
+        f for f in fissures
+        if isinstance(f, dict) and isinstance(f.get("expiry"), str) and not f.get("expired", False)
+    ]
+    # 收集所有需要转换的节点名与任务类型（去重），拼接后只调用一次 OpenCC 转换
+    uniq = list({f.get("node", "") for f in active_fissures} | {f.get("missionType", "") for f in active_fissures})
+    # 在线程中执行转换，避免 C 扩展的计算阻塞事件循环
+    converted = (await asyncio.to_thread(_CC.convert, _SEP.join(uniq))).split(_SEP)
+    if len(converted) != len(uniq):
+        # 拆分后的数量对不上（原文中含有分隔符等情况），退回到逐条转换，避免错位
+        converted = await asyncio.to_thread(lambda: [_CC.convert(text) for text in uniq])
+    trans = dict(zip(uniq, converted))  # 繁体 -> 简体 的对照表
+    output_list = []  # 初始化一个空列表，用于存储每个 fissure 的关键信息
+    # 获取当前 UTC 时间，并格式化为 ISO 8601 格式，其中 timespec='milliseconds' 表示保留毫秒部分
+    now = datetime.utcnow().isoformat(timespec='milliseconds') + 'Z'
+    # 遍历筛选后的 fissure 列表，输出每个 fissure 的关键信息
+    for fissure in active_fissures:
+        # 假设 fissure 中有 'node'、'missionType' 等字段需要转换
+        node_traditional = fissure.get("node", "")
+        mission_type_traditional = fissure.get("missionType", "")
+        # 从对照表中取出简体中文
+        node = trans[node_traditional]  # 获取 fissure 所在的节点
+        mission_type = trans[mission_type_traditional]  # 获取任务类型
+        ID = fissure.get("id")  # 获取此任务的ID
+        tier = fissure.get("tier")  # 获取 fissure
+        eta = fissure.get("eta")  # 获取剩余有效时间
+        ishard = fissure.get("isHard")  # 是否为钢铁之路
+        expiry = fissure.get("expiry")  # 节点的结束时间
+        # 预先把结束时间解析为时间戳，后续比较时只需比较数字
+        try:
+            expiry_ts = datetime.fromisoformat(expiry.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            continue  # 结束时间无法解析的记录直接跳过，不影响其他记录
+        # 构建一本字典，每个字段均封装为带有 value 和 type 的结构
+        output_line = {
+            "ID": {"value": ID, "type": "id"},  # ID 标记为字符串类型
+            "node": {"value": node, "type": "string"},  # 节点名称为字符串
+            "missionType": {"value": mission_type, "type": "string"},  # 任务类型为字符串
+            "tier": {"value": tier, "type": "string"},  # 缝隙类型为字符串
+            "eta": {"value": eta, "type": "time"},  # 剩余时间被标记为时间类型
+            "isHard": {"value": ishard, "type": "boolean"},  # 是否为钢铁之路为布尔类型
+            "expiry": {"value": expiry, "type": "time"},  # 标记节点的结束时间
+            "expiry_ts": {"value": expiry_ts, "type": "epoch"},  # 结束时间的时间戳（秒）
+            "now": {"value": now, "type": "time"}
+        }
+        # 将当前记录添加到列表中
+        output_list.append(output_line)
+    if SAVE_TO_FILE:
+        # 开启持久化时，在线程中写入文件，避免阻塞事件循环
+        await asyncio.to_thread(save_fissures_data, output_list)
+    return output_list
+
+
+def save_fissures_data(output_list):
+    # 将收集到的数据写入到一个 JSON 文件中，orjson 直接输出 UTF-8 字节，中文不会被转义
+    with open("fissures.json", "wb") as f:
+        f.write(orjson.dumps(output_list, option=orjson.OPT_INDENT_2))
+    print("数据已成功记录到文件中。")
+
+
+def _cache_valid(now: float) -> bool:
+    # 缓存未过期且缓存中的节点仍未结束时，缓存可直接使用
+    return _cache["data"] is not None and now - _cache["fetched_at"] < CACHE_TTL and now < _cache["min_expiry_ts"]
+
+
+async def _refresh_fissures():
+    # 重新获取数据并更新缓存，返回本次刷新的结果
+    now = time.time()
+    data = await update_fissures_data()  # 直接使用内存中的数据，不再经过文件中转
+    if data is None:
+        # 获取失败时，仅在上一次的结果节点尚未结束时退回到该结果
+        if _cache["data"] is not None and now < _cache["min_expiry_ts"]:
+            return _cache["data"]
+        return "裂缝数据获取失败，请稍后再试。"
+    if data:
+        min_time = min(data, key=lambda record: record['expiry_ts']['value'])
+        min_expiry_ts = min_time['expiry_ts']['value']
     else:
-        # 如果请求失败，则打印出错误状态码
-        print(f"请求失败，状态码: {response.status_code}")
+        # 获取成功但当前没有进行中的裂缝，同样缓存该提示，避免下一次指令立刻重新请求
+        min_time = "当前没有进行中的裂缝任务。"
+        min_expiry_ts = now + CACHE_TTL
+    # 更新缓存，记录结果节点的结束时间戳，节点结束后缓存随之失效
+    _cache["data"] = min_time
+    _cache["fetched_at"] = now
+    _cache["min_expiry_ts"] = min_expiry_ts
+    return min_time
 
 
 async def run_fissures_module():
     #文件的主函数，用于统合整个模块功能，
-    await update_fissures_data()
-    #加载JSON文件数据
-    with open("fissures.json", "r", encoding="utf-8") as f:
-        data = json.load(f)  # 加载整个 JSON 文件为 Python 对象（通常为列表）
-    min_time = min(
-        data,
-        key=lambda record: datetime.fromisoformat(record['expiry']['value'].replace("Z", "+00:00"))
-    )
+    global _refresh_task
+    if _cache_valid(time.time()):
+        return _cache["data"]  # 直接返回缓存结果，避免重复请求接口
+    if _refresh_task is None or _refresh_task.done():
+        # 没有进行中的刷新时才发起新的刷新，同一批并发请求（无论成功或失败）只请求一次接口
+        _refresh_task = asyncio.create_task(_refresh_fissures())
+    # shield 保证某个调用方被取消时不会连带取消其他调用方共享的刷新任务
+    min_time = await asyncio.shield(_refresh_task)
 
     # 这里可以继续执行其他逻辑，比如异步发送结果到聊天机器人后台
     return min_time
@@ -1,20 +1,6 @@
 from astrbot.api.event import filter, AstrMessageEvent
 from astrbot.api.star import Context, Star, register
-import importlib.util
-from pathlib import Path
-
-
-# 动态加载模块方案
-def load_module(module_name: str):
-    module_path = Path(__file__).parent / f"{module_name}.py"
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-dispatcher = load_module("dispatcher")
-output = load_module("output")
+from . import dispatcher, fissures, output  # 以包内相对导入的方式加载同级模块
 
 
 # 整个插件初始化
@@ -27,10 +13,12 @@ class MyPlugin(Star):
     @filter.event_message_type(filter.EventMessageType.GROUP_MESSAGE)
     async def on_private_message(self, event: AstrMessageEvent):
         st = event.message_str  # 提取聊天文字
-        # 添加类型安全处理
-        result = await dispatcher.magic_message(st)  # 转由分发器进行处理
-        # 通过输出模块处理结果（需传递事件上下文）
-        async for reply in output.output_plugin(event, result):
-            yield reply  # 逐条生成回复
-
-    async def terminate(self): """可选择实现异步的插件销毁方法，当插件被卸载/停用时会调用。"""
+        if st not in dispatcher.TRIGGERS:
+            return  # 与指令无关的群消息直接跳过，不进入分发与输出流程
+        result = await dispatcher.magic_message(st)  # 转由分发器进行处理，已登记的指令总是返回字符串
+        # 通过输出模块生成回复（需传递事件上下文）
+        yield output.output_plugin(event, result)  # 只有一条回复，直接生成
+
+    async def terminate(self):
+        """可选择实现异步的插件销毁方法，当插件被卸载/停用时会调用。"""
+        await fissures.close_session()  # 关闭裂缝模块共享的 HTTP 会话